@@ -3,12 +3,74 @@ Build script for Dodging Simulator
 This script creates an executable file that can be run without Python installed.
 """
 import os
+import hashlib
 import subprocess
 import shutil
 import sys
+import argparse
+from collections import deque
 
-def build_executable():
-    """Build the game executable using PyInstaller."""
+def remove_stale_bytecode(package_dir="Dodging_Simulator"):
+    """Delete cached .pyc files so optimized bytecode gets regenerated."""
+    for root, _, files in os.walk(package_dir):
+        for file_name in files:
+            if file_name.endswith(".pyc"):
+                os.remove(os.path.join(root, file_name))
+
+CACHE_KEY_PATH = os.path.join("build", ".cache_key")
+
+def compute_cache_key(cmd):
+    """Hash the PyInstaller command and the path, mtime and size of every input file."""
+    sources = ["build_game.py", "game_main.py", "game_app.py", "requirements.txt", "game_icon.ico"]
+    for data_dir in ["assets", "Dodging_Simulator"]:
+        for root, _, files in os.walk(data_dir):
+            sources.extend(os.path.join(root, f) for f in files if not f.endswith(".pyc"))
+    
+    digest = hashlib.sha256()
+    digest.update("\0".join(cmd).encode() + b"\n")
+    for path in sorted(sources):
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+def read_cache_key():
+    """Return the cache key stored by the previous build, if any."""
+    try:
+        with open(CACHE_KEY_PATH, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_cache_key(key):
+    """Remember the cache key of a successful build."""
+    os.makedirs("build", exist_ok=True)
+    with open(CACHE_KEY_PATH, "w") as f:
+        f.write(key)
+
+def run_streaming(cmd, env=None, tail_lines=200):
+    """Run a command, echoing its output live and keeping only the last lines.
+
+    Raises subprocess.CalledProcessError on failure with the retained tail
+    as its output.
+    """
+    tail = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1, env=env) as proc:
+        for line in proc.stdout:
+            print(line, end="")
+            tail.append(line)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output="".join(tail))
+
+def build_executable(single_file=False):
+    """Build the game executable using PyInstaller.
+
+    By default a one-folder build is produced, which starts much faster than
+    a single-file build because nothing has to be extracted on launch.
+    Pass single_file=True to get one self-extracting .exe for sharing.
+    Returns True if the executable is up to date afterwards.
+    """
     
     print("🎮 Building Dodging Simulator...")
     print("=" * 50)
@@ -22,7 +84,7 @@ def build_executable():
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",                    # Create a single executable file
+        "--noconfirm",                  # Replace dist/ output without prompting
         "--windowed",                   # Don't show console window
         "--icon=game_icon.ico",         # Use our custom icon
         "--name=Dodging_Simulator",     # Name of the executable
@@ -32,38 +94,80 @@ def build_executable():
         "game_main.py"                  # Main Python file
     ]
     
+    if single_file:
+        cmd.insert(1, "--onefile")      # Create a single executable file
+    
+    # Leave out modules the game never uses to keep the bundle small
+    excluded_modules = [
+        "tkinter", "unittest", "pydoc", "pydoc_data", "lib2to3",
+        "xmlrpc", "test", "distutils", "pygame.tests", "pygame.examples",
+    ]
+    for module in excluded_modules:
+        cmd.extend(["--exclude-module", module])
+    
     # Add data files (assets and modules)
     data_dirs = ["assets", "Dodging_Simulator"]
     for data_dir in data_dirs:
         if os.path.exists(data_dir):
             cmd.extend(["--add-data", f"{data_dir};{data_dir}"])
     
+    # Nothing to do if the last successful build used exactly these inputs
+    if single_file:
+        exe_path = "./dist/Dodging_Simulator.exe"
+    else:
+        exe_path = "./dist/Dodging_Simulator/Dodging_Simulator.exe"
+    cache_key = compute_cache_key(cmd)
+    if read_cache_key() == cache_key and os.path.exists(exe_path):
+        print("♻️  Sources unchanged since the last build, nothing to do")
+        print(f"📁 Executable is at: {exe_path}")
+        return True
+    
+    # Drop cached bytecode so nothing stale gets bundled
+    remove_stale_bytecode()
+    
+    # Strip asserts and docstrings from the bundled bytecode
+    env = {**os.environ, "PYTHONOPTIMIZE": "2"}
+    
     print("Running PyInstaller...")
     print(f"Command: {' '.join(cmd)}")
     print()
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        run_streaming(cmd, env=env)
+        write_cache_key(cache_key)
         print("✅ Build successful!")
-        print(f"📁 Executable created at: ./dist/Dodging_Simulator.exe")
-        print()
-        print("🎉 Your game is ready!")
-        print("You can now:")
-        print("1. Double-click 'Dodging_Simulator.exe' to play")
-        print("2. Share the .exe file with friends")
-        print("3. Move it to any Windows computer and it will run")
-        print()
-        print("💡 Tip: The executable contains everything needed to run the game!")
+        if single_file:
+            print(f"📁 Executable created at: ./dist/Dodging_Simulator.exe")
+            print()
+            print("🎉 Your game is ready!")
+            print("You can now:")
+            print("1. Double-click 'Dodging_Simulator.exe' to play")
+            print("2. Share the .exe file with friends")
+            print("3. Move it to any Windows computer and it will run")
+            print()
+            print("💡 Tip: The executable contains everything needed to run the game!")
+        else:
+            print(f"📁 Executable created at: ./dist/Dodging_Simulator/Dodging_Simulator.exe")
+            print()
+            print("🎉 Your game is ready!")
+            print("You can now:")
+            print("1. Double-click 'Dodging_Simulator.exe' to play")
+            print("2. Share the whole 'dist/Dodging_Simulator' folder with friends")
+            print()
+            print("💡 Tip: Use --single-file to build one .exe (slower to start)")
         
     except subprocess.CalledProcessError as e:
         print("❌ Build failed!")
-        print("Error output:")
-        print(e.stderr)
+        print("Last lines of output:")
+        print(e.output)
         print()
         print("💡 Common solutions:")
         print("1. Make sure PyInstaller is installed: pip install pyinstaller")
         print("2. Check that start_screen.py exists and runs correctly")
         print("3. Make sure all dependencies are installed")
+        return False
+    
+    return True
 
 def clean_build():
     """Clean up build artifacts."""
@@ -79,18 +183,23 @@ def clean_build():
         if os.path.exists(file_name):
             os.remove(file_name)
             print(f"🧹 Cleaned {file_name}")
+    
+    remove_stale_bytecode()
 
 if __name__ == "__main__":
     print("Dodging Simulator - Build Script")
     print("=" * 40)
     
-    if len(sys.argv) > 1 and sys.argv[1] == "clean":
+    parser = argparse.ArgumentParser(description="Build Dodging Simulator")
+    parser.add_argument("action", nargs="?", choices=["clean"],
+                        help="'clean' removes build artifacts instead of building")
+    parser.add_argument("--single-file", action="store_true",
+                        help="Bundle into one .exe (slower startup, easier to share)")
+    args = parser.parse_args()
+    
+    if args.action == "clean":
         clean_build()
     else:
-        build_executable()
-        
-        # Ask if user wants to clean up
-        response = input("\n🧹 Clean up build files? (y/n): ").lower().strip()
-        if response in ['y', 'yes']:
-            clean_build()
-            print("✨ All clean!")
+        if build_executable(single_file=args.single_file):
+            print("\n♻️  Build cache kept in build/ to speed up the next build")
+            print("   Run 'python build_game.py clean' to remove it")
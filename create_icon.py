@@ -2,30 +2,47 @@
 Simple script to create a game icon for Dodging Simulator.
 This creates a .ico file that can be used with PyInstaller.
 """
-import pygame
 import os
+import sys
 
-# Initialize pygame (just for creating the icon)
-pygame.init()
+# Skip the work if both icons are newer than this script (use --force to redo)
+icon_outputs = ["game_icon.png", "game_icon.ico"]
+if "--force" not in sys.argv and all(
+    os.path.exists(path) and os.path.getmtime(path) > os.path.getmtime(__file__)
+    for path in icon_outputs
+):
+    print("Icons are up to date, nothing to do.")
+    sys.exit(0)
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:
+    print("To create the icon, install Pillow:")
+    print("pip install Pillow")
+    print("Then run this script again.")
+    raise SystemExit(1)
 
 # Icon size (Windows standard is 32x32, but we'll create 64x64 for quality)
 icon_size = 64
-surface = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
 
 # Colors from your game
-background_color = (12, 12, 16)
+background_color = (12, 12, 16, 255)
 player_color = (80, 200, 255)
 projectile_color = (240, 96, 96)
 accent_color = (255, 255, 255)
 
 # Fill background
-surface.fill(background_color)
+img = Image.new("RGBA", (icon_size, icon_size), background_color)
+draw = ImageDraw.Draw(img)
 
 # Draw a stylized player (centered circle)
 player_radius = 8
 player_center = (icon_size // 2, icon_size // 2)
-pygame.draw.circle(surface, player_color, player_center, player_radius)
-pygame.draw.circle(surface, accent_color, player_center, player_radius, 2)
+draw.ellipse(
+    (player_center[0] - player_radius, player_center[1] - player_radius,
+     player_center[0] + player_radius, player_center[1] + player_radius),
+    fill=player_color, outline=accent_color, width=2
+)
 
 # Draw some projectiles around the player to show "dodging"
 projectile_positions = [
@@ -36,32 +53,14 @@ projectile_positions = [
 ]
 
 for pos in projectile_positions:
-    pygame.draw.rect(surface, projectile_color, (pos[0]-3, pos[1]-3, 6, 6))
-    pygame.draw.rect(surface, accent_color, (pos[0]-3, pos[1]-3, 6, 6), 1)
+    draw.rectangle((pos[0]-3, pos[1]-3, pos[0]+2, pos[1]+2), fill=projectile_color, outline=accent_color)
 
 # Add a subtle border
-pygame.draw.rect(surface, accent_color, (0, 0, icon_size, icon_size), 2)
-
-# Save as PNG first
-pygame.image.save(surface, "game_icon.png")
+draw.rectangle((0, 0, icon_size - 1, icon_size - 1), outline=accent_color, width=2)
 
+# Save as PNG (used by the README) and as a multi-size ICO for Windows
+img.save("game_icon.png")
 print("Icon created as 'game_icon.png'")
-print("To convert to .ico format for Windows:")
-print("You can use online converters or install Pillow and use the conversion script below.")
-
-# Also create a Pillow-based converter if available
-try:
-    from PIL import Image
-    
-    # Load the PNG and convert to ICO
-    img = Image.open("game_icon.png")
-    # Create multiple sizes for better Windows compatibility
-    img.save("game_icon.ico", format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64)])
-    print("Successfully created 'game_icon.ico' with multiple sizes!")
-    
-except ImportError:
-    print("\nTo create .ico file, install Pillow:")
-    print("pip install Pillow")
-    print("Then run this script again.")
 
-pygame.quit()
+img.save("game_icon.ico", format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64)])
+print("Successfully created 'game_icon.ico' with multiple sizes!")
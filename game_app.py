@@ -0,0 +1,296 @@
+"""
+Main game class using design patterns.
+This demonstrates proper OOP design with State, Observer, Factory, Singleton, and Strategy patterns.
+Imported lazily by game_main.py so that pygame and the game modules load only when the game runs.
+"""
+
+import os
+import time
+import pygame
+from typing import List, Optional, Tuple
+
+# Import design patterns
+from Dodging_Simulator.patterns.state import GameContext
+from Dodging_Simulator.patterns.observer import GameEventManager, ScoreObserver, StatsObserver
+from Dodging_Simulator.patterns.factory import ConcreteGameObjectFactory
+from Dodging_Simulator.patterns.singleton import GameConfig, GameState
+from Dodging_Simulator.patterns.strategy import (
+    GameModeContext, NormalModeStrategy, NightmareModeStrategy
+)
+
+# Import existing components
+from Dodging_Simulator.entities.player import Player
+from Dodging_Simulator.entities.enhanced_projectile import (
+    create_random_projectile, EnhancedProjectile, WarningIndicator,
+    ProjectileType, create_warning_for_longsword
+)
+from Dodging_Simulator.managers.score_manager import ScoreManager
+from Dodging_Simulator.managers.sound_manager import SoundManager
+from Dodging_Simulator.ui.menu import MenuScreen
+from Dodging_Simulator.ui.hall_of_fame import HallOfFameScreen
+from Dodging_Simulator.ui.hud import HUD
+from Dodging_Simulator.config import (
+    GAME_WIDTH, GAME_HEIGHT, BACKGROUND_COLOR, BACKGROUND_IMAGE, GAME_OVER_OVERLAY,
+    HUD_TEXT_COLOR
+)
+
+class DodgingSimulatorGame(GameContext):
+    """Main game class implementing design patterns."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        
+        # Initialize pygame
+        pygame.init()
+        pygame.font.init()
+        
+        # Setup display
+        self.window = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT))
+        pygame.display.set_caption("Dodging Simulator")
+        
+        # Drop event types the game never handles before they reach Python
+        pygame.event.set_blocked([
+            pygame.TEXTINPUT, pygame.TEXTEDITING,
+            pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+            pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP,
+        ])
+        
+        # Load assets
+        self._load_assets()
+        
+        # Initialize singletons
+        self.game_config = GameConfig()
+        self.game_state = GameState()
+        
+        # Initialize event system
+        self.event_manager = GameEventManager()
+        self.stats_observer = StatsObserver()
+        
+        # Initialize factories and strategies
+        self.factory = ConcreteGameObjectFactory()
+        self.game_mode_context = GameModeContext(NormalModeStrategy(self.event_manager))
+        
+        # Initialize managers
+        score_base_dir = os.path.dirname(__file__)
+        self.score_manager = ScoreManager(score_base_dir)
+        self.score_observer = ScoreObserver(self.score_manager)
+        
+        # Setup observers
+        self.event_manager.attach(self.score_observer)
+        self.event_manager.attach(self.stats_observer)
+        
+        # Initialize UI components
+        self._initialize_ui()
+        
+        # Rendered text cached between frames of the game over screen
+        self._top_scores_key: Optional[tuple] = None
+        self._top_scores_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._last_final_score: Optional[float] = None
+        self._score_surface: Optional[pygame.Surface] = None
+        
+        # Game objects
+        self.player: Optional[Player] = None
+        self.projectiles: List[EnhancedProjectile] = []
+        self.warning_indicators: List[WarningIndicator] = []
+        
+        # Initialize sound manager
+        self.sound_manager = SoundManager()
+        
+        # Timing
+        self.clock = pygame.time.Clock()
+        self._last_frame_time = time.perf_counter()
+        self.running = True
+        
+        # Start in menu state
+        self.transition_to_menu()
+    
+    def _load_assets(self) -> None:
+        """Load game assets."""
+        try:
+            self.background_image = pygame.image.load(BACKGROUND_IMAGE).convert()
+            # Convert again after scaling so blits stay on SDL's fast path
+            self.background_image = pygame.transform.scale(self.background_image, (GAME_WIDTH, GAME_HEIGHT)).convert()
+        except (pygame.error, FileNotFoundError):
+            print(f"Warning: Could not load background image from {BACKGROUND_IMAGE}")
+            # Create a fallback background
+            self.background_image = pygame.Surface((GAME_WIDTH, GAME_HEIGHT)).convert()
+            self.background_image.fill(BACKGROUND_COLOR)
+    
+    def _initialize_ui(self) -> None:
+        """Initialize UI components."""
+        self.default_font = pygame.font.SysFont("consolas", 22)
+        self.large_font = pygame.font.SysFont("consolas", 48, bold=True)
+        self.title_font = pygame.font.SysFont("consolas", 64, bold=True)
+        
+        # Game over overlay is static, so build it once in the display's format
+        self._game_over_overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
+        self._game_over_overlay.fill(GAME_OVER_OVERLAY)
+        self._game_over_overlay = self._game_over_overlay.convert_alpha()
+        
+        # Fixed game over text is rendered once as well
+        self._game_over_title = self.large_font.render("Game Over", True, HUD_TEXT_COLOR)
+        self._game_over_title_rect = self._game_over_title.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 120))
+        self._game_over_hint = self.default_font.render("Press R to restart  |  Esc to menu", True, HUD_TEXT_COLOR)
+        self._game_over_hint_rect = self._game_over_hint.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
+        
+        self.menu_screen = MenuScreen()
+        self.menu_screen.setup_buttons(self.default_font, self.title_font)
+        
+        self.hall_of_fame_screen = HallOfFameScreen(self.score_manager)
+        self.hall_of_fame_screen.setup_button(self.default_font)
+    
+    def set_game_mode(self, mode: str) -> None:
+        """Set the game mode using strategy pattern."""
+        if mode == "normal":
+            strategy = NormalModeStrategy(self.event_manager)
+        elif mode == "nightmare":
+            strategy = NightmareModeStrategy(self.event_manager)
+        else:
+            raise ValueError(f"Unknown game mode: {mode}")
+        
+        self.game_mode_context.set_strategy(strategy)
+        self.game_state.set_mode(mode)
+    
+    def transition_to_menu(self) -> None:
+        """Return to the menu, re-enabling mouse input for the menu screens."""
+        pygame.event.set_allowed([pygame.MOUSEMOTION, pygame.MOUSEWHEEL])
+        super().transition_to_menu()
+    
+    def initialize_game(self) -> None:
+        """Initialize game objects for new game."""
+        # Gameplay is keyboard driven, so skip the flood of mouse events
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEWHEEL])
+        
+        # Reset observers
+        self.stats_observer.reset()
+        
+        # Create player using factory
+        self.player = self.game_mode_context.create_player()
+        
+        # Clear projectiles and warnings
+        self.projectiles.clear()
+        self.warning_indicators.clear()
+        
+        # Setup spawn timer
+        spawn_interval = self.game_mode_context.get_spawn_interval(0.0)
+        self.current_spawn_interval = spawn_interval
+        pygame.time.set_timer(self.SPAWN_EVENT, spawn_interval)
+    
+    def spawn_projectile(self) -> None:
+        """Spawn a new projectile using factory pattern."""
+        projectile = self.game_mode_context.create_projectile()
+        self.projectiles.append(projectile)
+    
+    def render_game(self, surface: pygame.Surface, game_over: bool, elapsed_seconds: float, final_score: Optional[float]) -> None:
+        """Render the game state."""
+        # The background covers the whole window, so no separate clear is needed
+        surface.blit(self.background_image, (0, 0))
+        
+        if not game_over and self.player:
+            # Draw game objects
+            self.player.draw(surface)
+            for projectile in self.projectiles:
+                projectile.draw(surface)
+            
+            # Draw warning indicators
+            for warning in self.warning_indicators:
+                warning.draw(surface)
+            
+            # Draw HUD
+            mode_name = self.game_mode_context.get_mode_name()
+            HUD.draw_hearts(surface, self.player.health, self.player.max_health, mode_name)
+            HUD.draw_time(surface, elapsed_seconds)
+            
+            # Draw nightmare mode specific stats
+            if mode_name == "nightmare":
+                hearts_needed = 75 if self.stats_observer.hearts_restored == 0 else 150
+                next_heart_at = hearts_needed * (self.stats_observer.hearts_restored + 1)
+                HUD.draw_nightmare_stats(surface, self.stats_observer.projectiles_dodged, next_heart_at)
+        else:
+            # Draw game over screen
+            self._render_game_over(surface, final_score)
+    
+    def _render_game_over(self, surface: pygame.Surface, final_score: Optional[float]) -> None:
+        """Render game over screen."""
+        from Dodging_Simulator.utils.formatting import format_seconds
+        
+        # Draw overlay
+        surface.blit(self._game_over_overlay, (0, 0))
+        
+        # Draw game over text
+        surface.blit(self._game_over_title, self._game_over_title_rect)
+        
+        # Draw score
+        if self._score_surface is None or final_score != self._last_final_score:
+            if final_score is None:
+                final_text = "Score: 0.0s"
+            else:
+                final_text = f"Score: {format_seconds(final_score)}"
+            self._score_surface = self.default_font.render(final_text, True, HUD_TEXT_COLOR)
+            self._last_final_score = final_score
+        score_rect = self._score_surface.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 60))
+        surface.blit(self._score_surface, score_rect)
+        
+        # Draw instructions
+        surface.blit(self._game_over_hint, self._game_over_hint_rect)
+        
+        # Draw top scores
+        mode_name = self.game_mode_context.get_mode_name()
+        top = self.score_manager.top_scores(5, mode_name)
+        top_key = (mode_name, tuple(top))
+        if top_key != self._top_scores_key:
+            mode_text = "Normal Mode" if mode_name == "normal" else "Nightmare Mode"
+            highs_title = self.default_font.render(f"Top Scores ({mode_text})", True, HUD_TEXT_COLOR)
+            blits = [(highs_title, (GAME_WIDTH // 2 - highs_title.get_width() // 2, GAME_HEIGHT // 2 + 36))]
+            
+            for idx, value in enumerate(top, start=1):
+                line = self.default_font.render(f"{idx}. {format_seconds(value)}", True, HUD_TEXT_COLOR)
+                blits.append((line, (GAME_WIDTH // 2 - 80, GAME_HEIGHT // 2 + 36 + idx * 26)))
+            
+            self._top_scores_key = top_key
+            self._top_scores_blits = blits
+        
+        surface.blits(self._top_scores_blits, doreturn=False)
+    
+    def _precise_tick(self, fps: int) -> float:
+        """Wait for the next frame and return the elapsed time in seconds.
+        
+        Sleeps until shortly before the deadline, then busy-waits the rest,
+        which paces frames more evenly than Clock.tick() without spinning
+        for the whole frame.
+        """
+        deadline = self._last_frame_time + 1.0 / fps
+        remaining = deadline - time.perf_counter()
+        if remaining > 0.002:
+            # SDL_Delay has 1 ms resolution once pygame is initialised
+            pygame.time.delay(int((remaining - 0.002) * 1000))
+        while time.perf_counter() < deadline:
+            pass
+        
+        now = time.perf_counter()
+        dt_seconds = now - self._last_frame_time
+        self._last_frame_time = now
+        self.clock.tick()  # Keep the clock's FPS statistics up to date
+        return dt_seconds
+    
+    def run(self) -> None:
+        """Main game loop."""
+        while self.running and self.game_state.game_running:
+            dt_seconds = self._precise_tick(60)
+            
+            # Handle events
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                else:
+                    self.handle_event(event)
+            
+            # Update
+            self.update(dt_seconds)
+            
+            # Render
+            self.render(self.window)
+            pygame.display.update()
+        
+        pygame.quit()
+